@@ -17,13 +17,28 @@ import serial.tools.list_ports
 import time
 import threading
 import logging
+import logging.handlers
+import atexit
 import os
+import glob
 from datetime import datetime
 import signal
 import sys
 import queue
 import json
 import re
+import functools
+from collections import deque
+
+try:
+    import orjson  # Optional: much faster JSON encoding for the polled endpoints
+except ImportError:
+    orjson = None
+
+try:
+    import waitress  # Optional: production WSGI server, Flask dev server otherwise
+except ImportError:
+    waitress = None
 
 app = Flask(__name__)
 CORS(app, resources={
@@ -34,17 +49,74 @@ CORS(app, resources={
     }
 })
 
-# Enhanced logging configuration
+def encode_json(payload):
+    """Serialize a payload to JSON bytes - orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode('utf-8')
+
+def json_response(payload):
+    """JSON response via orjson when available, Flask's jsonify otherwise"""
+    if orjson is None:
+        return jsonify(payload)
+    return app.response_class(encode_json(payload), mimetype='application/json')
+
+# Fixed error bodies, encoded once - hit on every guarded request while the Arduino is unplugged
+NOT_CONNECTED_BODY = json.dumps({'status': 'error', 'message': 'Arduino not connected'}).encode('utf-8')
+NO_CONTROLLER_BODY = json.dumps({'status': 'error', 'message': 'No Arduino controller available'}).encode('utf-8')
+
+def static_json_response(body, status):
+    """Response for a pre-encoded JSON body"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
+def requires_arduino(view):
+    """Reject the request with the cached 503 unless the Arduino is connected"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        controller = arduino_controller
+        if not controller or not controller.is_connected:
+            return static_json_response(NOT_CONNECTED_BODY, 503)
+        return view(*args, **kwargs)
+    return wrapper
+
+# Response timestamp for polled endpoints - formatted at most once per TTL, not per request
+TIMESTAMP_CACHE_TTL = 0.1
+_timestamp_cache = {'expires': 0.0, 'iso': ''}
+
+def cached_now_iso():
+    """datetime.now().isoformat(), refreshed at most every TIMESTAMP_CACHE_TTL seconds"""
+    current = time.monotonic()
+    if current >= _timestamp_cache['expires']:
+        _timestamp_cache['iso'] = datetime.now().isoformat()
+        _timestamp_cache['expires'] = current + TIMESTAMP_CACHE_TTL
+    return _timestamp_cache['iso']
+
+# Enhanced logging configuration - file/console writes happen on a listener
+# thread so request and serial threads never block on log I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('spectraloop_dual_reflector.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+# The QueueHandler must pass the bare message on - the listener's handlers add the real format
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('spectraloop_dual_reflector.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# History sizes - the state below keeps bounded ring buffers (append evicts the oldest entry in O(1))
+MAX_TEMP_HISTORY = 200
+MAX_REFLECTOR_HISTORY = 500         # Keep max 500 speed measurements
+
 # Thread-safe global state
 motor_states = {i: False for i in range(1, 7)}
 individual_motor_speeds = {i: 0 for i in range(1, 7)}
@@ -58,7 +130,7 @@ temperature_data = {
     'temp_alarm': False,
     'buzzer_active': False,
     'last_temp_update': datetime.now(),
-    'temp_history': [],
+    'temp_history': deque(maxlen=MAX_TEMP_HISTORY),
     'max_temp_reached': 25.0,
     'max_temp_sensor1': 25.0,       # Individual max temps
     'max_temp_sensor2': 25.0,       # Individual max temps
@@ -97,7 +169,7 @@ reflector_data = {
         'uptime_start': datetime.now(),
         'detection_rate': 0.0,      # Detections per minute
         'max_speed_recorded': 0.0,  # Maximum speed recorded
-        'speed_history': []         # Speed history for trends
+        'speed_history': deque(maxlen=MAX_REFLECTOR_HISTORY)  # Speed history for trends
     },
     'statistics': {                 # Statistical data
         'session_count': 0,         # Count for current session
@@ -131,39 +203,84 @@ shutdown_event = threading.Event()
 TEMP_ALARM_THRESHOLD = 55.0
 TEMP_SAFE_THRESHOLD = 50.0
 TEMP_WARNING_THRESHOLD = 45.0
-MAX_TEMP_HISTORY = 200
 
 # REFLECTOR SYSTEM Constants
 REFLECTOR_REPORT_INTERVAL = 1.0     # Report reflector data every 1 second
-MAX_REFLECTOR_HISTORY = 500         # Keep max 500 speed measurements
 REFLECTOR_TIMEOUT = 30.0            # Consider system inactive after 30s
 
 # DUAL SENSOR Constants
 TEMP_DIFF_WARNING = 5.0  # Warn if sensors differ by more than 5°C
 TEMP_SENSOR_TIMEOUT = 10.0  # Consider sensor failed if no updates for 10s
 
+# Update frequency tracking - EWMA of the gap between samples, kept by the reader thread;
+# the sensor health monitor zeroes the reported value when a stream goes stale
+RATE_EWMA_ALPHA = 0.1       # Weight of the newest inter-sample gap
+RATE_STALE_AFTER = 3.0      # Report 0 Hz when no sample arrived for this long
+
+API_VERSION = '3.7-DUAL-TEMPERATURE-REFLECTOR-FIXED'
+
+# Serial port discovery
+PORT_CACHE_FILE = os.path.expanduser('~/.spectraloop_port')
+ARDUINO_PORT_KEYWORDS = ('arduino', 'usb serial', 'ch340', 'cp210', 'ftdi', 'usb-serial')
+FALLBACK_PORT_PATTERNS = (
+    # Linux/Raspberry Pi
+    '/dev/ttyUSB*', '/dev/ttyACM*', '/dev/ttyAMA0', '/dev/ttyS0',
+    # Mac
+    '/dev/cu.usbmodem*', '/dev/cu.usbserial*'
+)
+FALLBACK_COM_PORTS = ('COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'COM10')
+
+# Serial command queue
+MAX_COMMAND_QUEUE = 200  # Backpressure limit for queued (retried) commands
+REPLY_WAIT_SLICE = 0.2   # Re-check shutdown this often while waiting for a reply
+USB_LATENCY_TIMER_MS = 1  # usb-serial latency_timer (kernel default is 16ms)
+# Fixed protocol commands, encoded once instead of on every send
+COMMAND_BYTES = {command: f"{command}\n".encode('utf-8') for command in ("PING", "ARM", "REFLECTOR_RESET")}
+
+# Connection monitor
+HEARTBEAT_INTERVAL = 60.0   # PING the Arduino after this many idle seconds
+RECONNECT_INTERVAL = 15.0   # Wait after the first failed automatic reconnection attempt
+RECONNECT_MAX_INTERVAL = 120.0  # Cap for the doubling wait during a long outage
+
+# Background monitor
+MONITOR_INTERVAL = 5.0             # Staleness/reflector checks
+MONITOR_RECONNECT_MAX_WAIT = 30.0  # Fallback reconnects (connection monitor thread dead) - doubling wait cap
+
+# Arduino reply lines that complete a command
+COMMAND_REPLY_KEYWORDS = (
+    "MOTOR_STARTED", "MOTOR_STOPPED", "MOTOR_SPEED", "LEV_GROUP_STARTED",
+    "THR_GROUP_STARTED", "ARMED", "RELAY_BRAKE:", "PONG", "ACK:", "BRAKE_",
+    "DISARMED", "EMERGENCY_STOP", "DUAL-TEMP", "TEMP_DUAL", "TEMP_BYPASS",
+    "REFLECTOR_RESET", "REFLECTOR_FULL", "FAULT-TOLERANT", "ERROR:"
+)
+
+# Handshake / reply matchers - compiled once, matched without case-folding copies
+HANDSHAKE_PATTERN = re.compile(rb'PONG|ACK|DUAL-TEMP|REFLECTOR|READY|FAULT-TOLERANT', re.IGNORECASE)
+ARMED_REPLY_PATTERN = re.compile(r'\bARMED\b', re.IGNORECASE)
+
 class DualTempReflectorArduinoController:
     def __init__(self, port=None, baudrate=115200):
         self.port = port or self.find_arduino_port()
         self.baudrate = baudrate
         self.connection = None
         self.is_connected = False
-        self.last_command_time = 0
+        self.last_command_time = 0  # time.monotonic() of the last write
         self.reconnect_attempts = 0
         self.max_attempts = 5
         
-        # Command processing
-        self.command_queue = queue.Queue(maxsize=200)
+        # Command processing - SimpleQueue: C-level put/get, consumer blocks in get()
+        self.command_queue = queue.SimpleQueue()
         self.response_timeout = 2.0
         
         # Connection management
         self.connection_lock = threading.Lock()
+        self.reply_queue = None  # Set by send_command_sync while a command awaits its reply
+        self.link_event = threading.Event()  # Set when the link drops; wakes the connection monitor
         
         # Background threads
         self.processor_thread = None
         self.monitor_thread = None
         self.continuous_reader_thread = None
-        self.temp_stats_thread = None
         self.sensor_health_thread = None
         self.reflector_stats_thread = None
         
@@ -173,18 +290,24 @@ class DualTempReflectorArduinoController:
         self.temp2_pattern = re.compile(r'\[TEMP2:([\d.-]+)\]')
         self.max_temp_pattern = re.compile(r'\[MAX:([\d.-]+)\]')
         self.reflector_pattern = re.compile(r'\[REFLECTOR:([\d]+)\]')
-        self.dual_temp_pattern = re.compile(r'DUAL_TEMP \[TEMP1:([\d.-]+)\] \[TEMP2:([\d.-]+)\] \[MAX:([\d.-]+)\]')
-        self.heartbeat_pattern = re.compile(r'HEARTBEAT:(\d+),(\d),(\d),(\d),([\d.-]+),(\d),(\d)')
-        # FIXED: R: format pattern for reflector data
-        self.r_format_pattern = re.compile(r'^R:([\d]+):([\d.-]+):([\d.-]+):([\d.-]+)$')
-        self.reflector_detected_pattern = re.compile(r'REFLECTOR_DETECTED:([\d]+) \[VOLTAGE:([\d.-]+)V\] \[SPEED:([\d.-]+)rpm\]')
+        self.ref_speed_pattern = re.compile(r'\[REF_SPEED:([\d.-]+)\]')
+        self.reflector_final_pattern = re.compile(r'REFLECTOR_FINAL:([\d]+)')
         self.temp_alarm_pattern = re.compile(r'TEMP_ALARM:([\d.-]+)')
         self.temp_safe_pattern = re.compile(r'TEMP_SAFE:([\d.-]+)')
+        # Fixed-format telemetry lines - the parser picks one by literal prefix, then match() anchors it
+        # FIXED: R: format pattern for reflector data - R:count:voltage:instant_speed:avg_speed
+        self.r_format_pattern = re.compile(r'R:(\d+):([\d.-]+):([\d.-]+):([\d.-]+)$')
+        self.reflector_detected_pattern = re.compile(r'REFLECTOR_DETECTED:(\d+) \[VOLTAGE:([\d.-]+)V\] \[SPEED:([\d.-]+)rpm\]')
+        self.dual_temp_pattern = re.compile(r'DUAL_TEMP \[TEMP1:([\d.-]+)\] \[TEMP2:([\d.-]+)\] \[MAX:([\d.-]+)\]')
+        self.heartbeat_pattern = re.compile(r'HEARTBEAT:(\d+),(\d),(\d),(\d),([\d.-]+),(\d),(\d)')
         
         # Performance tracking - DUAL SENSOR + REFLECTOR - FIXED
-        self.temp_updates_count = 0
-        self.reflector_updates_count = 0
-        self.last_stats_time = time.time()
+        self.temp_ewma_dt = 0.1             # Smoothed seconds between temperature samples (~10Hz stream)
+        self.reflector_ewma_dt = 1.0        # Smoothed seconds between reflector samples (1Hz R: lines)
+        self.last_temp_sample = None        # time.monotonic() of the previous sample
+        self.last_reflector_sample = None
+        self.last_temp_history_time = 0.0   # time.monotonic() of the last history entries
+        self.last_speed_history_time = 0.0
         self.sensor_health_stats = {
             'sensor1_updates': 0,
             'sensor2_updates': 0,
@@ -202,7 +325,6 @@ class DualTempReflectorArduinoController:
                 self._start_command_processor()
                 self._start_connection_monitor()
                 self._start_continuous_reader()
-                self._start_temp_stats_monitor()
                 self._start_sensor_health_monitor()
                 self._start_reflector_stats_monitor()
                 logger.info("Arduino controller initialized successfully")
@@ -221,44 +343,38 @@ class DualTempReflectorArduinoController:
     def find_arduino_port(self):
         """Find available Arduino port - Cross-platform compatible - FIXED"""
         try:
+            # Fast path: the port that connected last time
+            cached_port = self._load_cached_port()
+            if cached_port:
+                logger.info(f"Using cached Arduino port: {cached_port}")
+                return cached_port
+            
             ports = serial.tools.list_ports.comports()
             logger.info(f"Found {len(ports)} serial ports")
             
-            # Look for Arduino-specific ports
+            # Look for Arduino-specific ports - comports() only lists present devices,
+            # so no test open (which also resets the Arduino) is needed
             for port in ports:
                 description = port.description.lower()
                 logger.debug(f"Checking port: {port.device} - {port.description}")
-                if any(keyword in description for keyword in ['arduino', 'usb serial', 'ch340', 'cp210', 'ftdi', 'usb-serial']):
-                    try:
-                        # Test the port
-                        test_conn = serial.Serial(port.device, self.baudrate, timeout=1)
-                        test_conn.close()
-                        logger.info(f"Found Arduino port: {port.device} - {port.description}")
-                        return port.device
-                    except Exception as e:
-                        logger.debug(f"Port {port.device} test failed: {e}")
-                        continue
+                if any(keyword in description for keyword in ARDUINO_PORT_KEYWORDS):
+                    logger.info(f"Found Arduino port: {port.device} - {port.description}")
+                    return port.device
             
-            # Fallback to common port names
-            common_ports = [
-                # Linux/Raspberry Pi
-                '/dev/ttyUSB0', '/dev/ttyUSB1', '/dev/ttyACM0', '/dev/ttyACM1',
-                '/dev/ttyAMA0', '/dev/ttyS0',
-                # Windows
-                'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'COM10',
-                # Mac
-                '/dev/cu.usbmodem*', '/dev/cu.usbserial*'
-            ]
+            # Fallback to common device nodes (Linux/Raspberry Pi + Mac) in one glob pass
+            for pattern in FALLBACK_PORT_PATTERNS:
+                matches = sorted(glob.glob(pattern))
+                if matches:
+                    logger.info(f"Found valid port: {matches[0]}")
+                    return matches[0]
             
-            for port in common_ports:
+            # Windows COM ports cannot be checked for existence - probe them
+            for port in FALLBACK_COM_PORTS:
                 try:
-                    if '*' in port:
-                        continue
-                    if os.path.exists(port) or port.startswith('COM'):
-                        test_conn = serial.Serial(port, self.baudrate, timeout=1)
-                        test_conn.close()
-                        logger.info(f"Found valid port: {port}")
-                        return port
+                    test_conn = serial.Serial(port, self.baudrate, timeout=1)
+                    test_conn.close()
+                    logger.info(f"Found valid port: {port}")
+                    return port
                 except Exception:
                     continue
             
@@ -269,6 +385,40 @@ class DualTempReflectorArduinoController:
             logger.error(f"Port scanning error: {e}")
             return None
     
+    def _load_cached_port(self):
+        """Return the last working port if it is still present"""
+        try:
+            with open(PORT_CACHE_FILE) as f:
+                cached_port = f.read().strip()
+        except OSError:
+            return None
+        
+        if not cached_port:
+            return None
+        if cached_port.startswith('COM'):
+            try:
+                test_conn = serial.Serial(cached_port, self.baudrate, timeout=1)
+                test_conn.close()
+                return cached_port
+            except Exception:
+                return None
+        return cached_port if os.path.exists(cached_port) else None
+    
+    def _save_cached_port(self):
+        """Remember the working port for the next startup/reconnect"""
+        try:
+            with open(PORT_CACHE_FILE, 'w') as f:
+                f.write(self.port)
+        except OSError as e:
+            logger.debug(f"Could not cache port: {e}")
+    
+    def _forget_cached_port(self):
+        """Drop the cached port so the next scan starts from scratch"""
+        try:
+            os.remove(PORT_CACHE_FILE)
+        except OSError:
+            pass
+    
     def connect(self):
         """Connect to Arduino with enhanced reliability - FIXED"""
         if self.reconnect_attempts >= self.max_attempts:
@@ -303,16 +453,18 @@ class DualTempReflectorArduinoController:
                 )
                 
                 logger.info(f"Serial connection opened: {self.port} @ {self.baudrate}")
+                self._enable_low_latency()
                 
                 # Wait for Arduino to initialize
                 time.sleep(2)
-                self.connection.flushInput()
-                self.connection.flushOutput()
+                self.connection.reset_input_buffer()
+                self.connection.reset_output_buffer()
                 
                 # Test connection
                 if self._test_connection():
                     self.is_connected = True
                     self.reconnect_attempts = 0
+                    self._save_cached_port()
                     system_state['connected'] = True
                     system_state['reflector_system_enabled'] = True
                     logger.info("Arduino connection successful - DUAL TEMPERATURE + REFLECTOR safety system active")
@@ -323,6 +475,7 @@ class DualTempReflectorArduinoController:
         except Exception as e:
             self.reconnect_attempts += 1
             logger.error(f"Connection error (attempt {self.reconnect_attempts}/{self.max_attempts}): {e}")
+            self._forget_cached_port()
             system_state['connected'] = False
             system_state['reflector_system_enabled'] = False
             self.is_connected = False
@@ -334,6 +487,24 @@ class DualTempReflectorArduinoController:
                 self.connection = None
             return False
     
+    def _enable_low_latency(self):
+        """Cut USB-serial round-trip latency (ASYNC_LOW_LATENCY + FTDI latency timer) - Linux only"""
+        try:
+            self.connection.set_low_latency_mode(True)
+            logger.info("Serial low latency mode enabled")
+        except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+            logger.debug(f"Low latency mode not available on {self.port}: {e}")
+        
+        # usb-serial adapters (FTDI/CH340/CP210x) buffer up to 16ms by default
+        if self.port.startswith('/dev/ttyUSB'):
+            latency_timer = f"/sys/bus/usb-serial/devices/{os.path.basename(self.port)}/latency_timer"
+            try:
+                with open(latency_timer, 'w') as f:
+                    f.write(str(USB_LATENCY_TIMER_MS))
+                logger.info(f"USB latency timer set to {USB_LATENCY_TIMER_MS}ms")
+            except OSError as e:
+                logger.debug(f"Could not set USB latency timer: {e}")
+    
     def _test_connection(self):
         """Test Arduino connection - FIXED"""
         try:
@@ -341,27 +512,26 @@ class DualTempReflectorArduinoController:
                 return False
             
             # Send PING command
-            self.connection.write(b"PING\n")
+            self.connection.write(COMMAND_BYTES["PING"])
             self.connection.flush()
             
-            start_time = time.time()
-            response = ""
+            # Block in the driver until each line arrives (port timeout bounds each read)
+            deadline = time.monotonic() + 3.0  # Increased timeout
+            response = bytearray()
             
-            while time.time() - start_time < 3.0:  # Increased timeout
-                if self.connection.in_waiting > 0:
-                    try:
-                        data = self.connection.read(self.connection.in_waiting)
-                        response += data.decode('utf-8', errors='ignore')
-                        
-                        if any(keyword in response.upper() for keyword in ["PONG", "ACK", "DUAL-TEMP", "REFLECTOR", "READY", "FAULT-TOLERANT"]):
-                            logger.info(f"Arduino responded: {response.strip()}")
-                            return True
-                    except Exception as e:
-                        logger.debug(f"Read error during test: {e}")
-                        break
-                time.sleep(0.05)
+            while time.monotonic() < deadline:
+                try:
+                    line = self.connection.read_until(b'\n')
+                except Exception as e:
+                    logger.debug(f"Read error during test: {e}")
+                    break
+                
+                response += line
+                if HANDSHAKE_PATTERN.search(response):
+                    logger.info(f"Arduino responded: {response.decode('utf-8', errors='ignore').strip()}")
+                    return True
             
-            logger.warning(f"Arduino test failed. Response: '{response.strip()}'")
+            logger.warning(f"Arduino test failed. Response: '{response.decode('utf-8', errors='ignore').strip()}'")
             return False
             
         except Exception as e:
@@ -375,16 +545,7 @@ class DualTempReflectorArduinoController:
         
         self.continuous_reader_thread = threading.Thread(target=self._continuous_reader, daemon=True, name="DualTempReflectorReader")
         self.continuous_reader_thread.start()
-        logger.info("DUAL TEMPERATURE + REFLECTOR continuous reader started (25ms intervals)")
-    
-    def _start_temp_stats_monitor(self):
-        """Temperature + Reflector update frequency monitor - FIXED"""
-        if self.temp_stats_thread and self.temp_stats_thread.is_alive():
-            return
-        
-        self.temp_stats_thread = threading.Thread(target=self._temp_stats_monitor, daemon=True, name="DualTempReflectorStats")
-        self.temp_stats_thread.start()
-        logger.info("DUAL temperature + reflector statistics monitor started")
+        logger.info("DUAL TEMPERATURE + REFLECTOR continuous reader started (blocking reads)")
     
     def _start_sensor_health_monitor(self):
         """Monitor individual sensor + reflector health - FIXED"""
@@ -425,18 +586,15 @@ class DualTempReflectorArduinoController:
                     
                     # Add to speed history (limited to prevent memory issues)
                     speed_history = reflector_data['performance']['speed_history']
-                    if len(speed_history) == 0 or (current_time - datetime.fromisoformat(speed_history[-1]['timestamp'])).total_seconds() >= 5:
+                    now_mono = time.monotonic()
+                    if len(speed_history) == 0 or now_mono - self.last_speed_history_time >= 5:
+                        self.last_speed_history_time = now_mono
                         speed_history.append({
                             'timestamp': current_time.isoformat(),
                             'average_speed': reflector_data['average_speed'],
                             'instant_speed': reflector_data['instant_speed'],
                             'count': reflector_data['count']
                         })
-                        
-                        # Keep history limited
-                        if len(speed_history) > MAX_REFLECTOR_HISTORY:
-                            speed_history = speed_history[-MAX_REFLECTOR_HISTORY:]
-                            reflector_data['performance']['speed_history'] = speed_history
                     
                     # Daily reset check
                     daily_start = reflector_data['statistics']['daily_start']
@@ -445,11 +603,11 @@ class DualTempReflectorArduinoController:
                         reflector_data['statistics']['daily_start'] = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
                         logger.info(f"Daily reflector count reset. Yesterday's count: {reflector_data['count']}")
                 
-                time.sleep(5)  # Update every 5 seconds
+                shutdown_event.wait(5)  # Update every 5 seconds
                 
             except Exception as e:
                 logger.error(f"Reflector stats monitor error: {e}")
-                time.sleep(5)
+                shutdown_event.wait(5)
     
     def _sensor_health_monitor(self):
         """Monitor individual sensor + reflector health and connection status - FIXED"""
@@ -489,6 +647,14 @@ class DualTempReflectorArduinoController:
                         system_state['reflector_system_enabled'] = True
                         logger.info("Reflector system reactivated")
                     
+                    # EWMA frequencies only move on new samples - zero them once the stream goes quiet.
+                    # Second writer of these keys besides the reader; the next sample overwrites the 0
+                    now_mono = time.monotonic()
+                    if self.last_temp_sample is None or now_mono - self.last_temp_sample > RATE_STALE_AFTER:
+                        temperature_data['update_frequency'] = 0.0
+                    if self.last_reflector_sample is None or now_mono - self.last_reflector_sample > RATE_STALE_AFTER:
+                        reflector_data['read_frequency'] = 0.0
+                    
                     # YENI: Sensör durumunu güncelle ve monitoring'i kontrol et
                     sensors_available = temperature_data['sensor1_connected'] or temperature_data['sensor2_connected']
                     
@@ -513,95 +679,114 @@ class DualTempReflectorArduinoController:
                         if temp_diff > TEMP_DIFF_WARNING:
                             logger.warning(f"Large temperature difference: S1={temperature_data['sensor1_temp']:.1f}°C, S2={temperature_data['sensor2_temp']:.1f}°C (Diff: {temp_diff:.1f}°C)")
                 
-                time.sleep(5)  # Check every 5 seconds
+                shutdown_event.wait(5)  # Check every 5 seconds
                 
             except Exception as e:
                 logger.error(f"Sensor + reflector health monitor error: {e}")
-                time.sleep(5)
+                shutdown_event.wait(5)
     
-    def _temp_stats_monitor(self):
-        """Monitor temperature + reflector update frequency - NO WARNING IF NO SENSORS - FIXED"""
-        while not shutdown_event.is_set():
-            try:
-                time.sleep(1.0)
-                
-                current_time = time.time()
-                elapsed = current_time - self.last_stats_time
-                
-                if elapsed >= 1.0:
-                    temp_updates_per_second = self.temp_updates_count / elapsed
-                    reflector_updates_per_second = self.reflector_updates_count / elapsed
-                    
-                    with state_lock:
-                        temperature_data['update_frequency'] = round(temp_updates_per_second, 2)
-                        reflector_data['read_frequency'] = round(reflector_updates_per_second, 2)
-                    
-                    # SADECE SENSÖR VARSA ve veri gelmiyorsa uyar
-                    if temperature_data['sensors_detected']:
-                        if temp_updates_per_second > 0:
-                            logger.debug(f"Dual temperature updates: {temp_updates_per_second:.2f} Hz")
-                        else:
-                            logger.debug("No dual temperature updates received (sensors should be sending)")
-                    
-                    # Reflector updates - FIXED - Always log reflector data
-                    if reflector_updates_per_second > 0:
-                        logger.debug(f"Reflector updates: {reflector_updates_per_second:.2f} Hz")
-                    else:
-                        logger.debug("No reflector updates received")
-                    
-                    # Reset counters
-                    self.temp_updates_count = 0
-                    self.reflector_updates_count = 0
-                    self.last_stats_time = current_time
-                
-            except Exception as e:
-                logger.error(f"Dual temperature + reflector stats monitor error: {e}")
-                time.sleep(5)
+    def _note_temp_update(self):
+        """Fold one temperature sample into the update frequency EWMA - only the reader updates the EWMA"""
+        now = time.monotonic()
+        last = self.last_temp_sample
+        # After a stall (reconnect, sensor gap) restart from the next sample instead of folding the gap in
+        if last is not None and now - last <= RATE_STALE_AFTER:
+            self.temp_ewma_dt += RATE_EWMA_ALPHA * ((now - last) - self.temp_ewma_dt)
+            temperature_data['update_frequency'] = round(1.0 / self.temp_ewma_dt, 2) if self.temp_ewma_dt > 0 else 0.0
+        self.last_temp_sample = now
+    
+    def _note_reflector_update(self):
+        """Fold one reflector sample into the read frequency EWMA - only the reader updates the EWMA"""
+        now = time.monotonic()
+        last = self.last_reflector_sample
+        if last is not None and now - last <= RATE_STALE_AFTER:
+            self.reflector_ewma_dt += RATE_EWMA_ALPHA * ((now - last) - self.reflector_ewma_dt)
+            reflector_data['read_frequency'] = round(1.0 / self.reflector_ewma_dt, 2) if self.reflector_ewma_dt > 0 else 0.0
+        self.last_reflector_sample = now
     
     def _continuous_reader(self):
         """DUAL SENSOR + REFLECTOR: Ultra-fast Arduino stream reader - FIXED"""
         logger.info("DUAL TEMPERATURE + REFLECTOR continuous reader started")
-        buffer = ""
+        buffer = bytearray()  # Raw bytes - only complete lines get decoded
+        # Bound once - looked up for every line otherwise
+        parse_line = self._parse_dual_temp_reflector_line
+        is_shutdown = shutdown_event.is_set
         
-        while not shutdown_event.is_set():
+        while not is_shutdown():
             try:
                 if not self.is_connected or not self.connection:
-                    time.sleep(0.5)
+                    shutdown_event.wait(0.5)
                     continue
                 
-                # Ultra-fast reading
-                if self.connection.in_waiting > 0:
-                    try:
-                        data = self.connection.read(self.connection.in_waiting)
-                        new_data = data.decode('utf-8', errors='ignore')
-                        buffer += new_data
+                # Block until bytes arrive (pyserial waits in select() on the port) or the
+                # port timeout expires, then drain everything already buffered in one read
+                connection = self.connection
+                try:
+                    data = connection.read(connection.in_waiting or 1)
+                except (serial.SerialException, OSError) as e:
+                    # read() wraps OS errors, but the in_waiting ioctl raises a bare OSError (EIO on unplug)
+                    if self.is_connected and connection is self.connection:
+                        self._mark_link_lost(f"Serial read failed: {e}")
+                    continue
+                
+                if not data:
+                    continue
+                
+                try:
+                    buffer += data
+                    
+                    # Process complete lines - one decode per line (the sketch prints °C, so UTF-8)
+                    start = 0
+                    end = buffer.find(b'\n')
+                    while end != -1:
+                        line = buffer[start:end].strip().decode('utf-8', errors='ignore')
+                        start = end + 1
+                        end = buffer.find(b'\n', start)
                         
-                        # Process complete lines
-                        while '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                            line = line.strip()
-                            
-                            if line:
-                                self._parse_dual_temp_reflector_line(line)
+                        if line:
+                            replies = self.reply_queue
+                            if replies is not None:
+                                replies.put(line)
+                            parse_line(line)
                     
-                    except Exception as e:
-                        logger.debug(f"Dual temp + reflector read error: {e}")
+                    # Keep only the unterminated tail
+                    if start:
+                        del buffer[:start]
                 
-                time.sleep(0.025)  # 25ms polling
+                except Exception as e:
+                    logger.debug("Dual temp + reflector read error: %s", e)
                 
             except Exception as e:
-                logger.error(f"Dual temperature + reflector reader error: {e}")
-                time.sleep(1)
+                logger.error("Dual temperature + reflector reader error: %s", e)
+                shutdown_event.wait(1)
         
         logger.info("DUAL TEMPERATURE + REFLECTOR reader stopped")
     
     def _parse_dual_temp_reflector_line(self, line):
         """ENHANCED: Parse dual temperature + reflector Arduino lines - SENSOR DETECTION ADDED - FIXED"""
         try:
+            # Hot path: temperature reading format - T1:25.0 T2:26.1 MAX:26.1 (most frequent line)
+            # Fixed prefixes, so slice + float() is enough - no regex scan
+            if line.startswith("T1:"):
+                try:
+                    t1_field, t2_field, max_field = line.split()
+                    if t2_field.startswith("T2:") and max_field.startswith("MAX:"):
+                        temp1, temp2, max_temp = float(t1_field[3:]), float(t2_field[3:]), float(max_field[4:])
+                        
+                        self._update_dual_temperatures(temp1, temp2, max_temp)
+                        self._note_temp_update()
+                        logger.debug("T1/T2/MAX format: S1=%s°C, S2=%s°C, Max=%s°C", temp1, temp2, max_temp)
+                        return
+                except ValueError:
+                    pass  # Malformed variant - falls through to the generic debug log
+            
             current_time = datetime.now()
             
+            # Fixed-format lines: a startswith() picks the candidate pattern, so lines with
+            # none of these prefixes skip the regex scans entirely
+            r_match = self.r_format_pattern.match(line) if line.startswith("R:") else None
+            
             # 0. R: format parsing - R:count:voltage:instant_speed:avg_speed - FIXED PATTERN MATCHING
-            r_match = self.r_format_pattern.match(line)
             if r_match:
                 try:
                     count = int(r_match.group(1))
@@ -623,87 +808,68 @@ class DualTempReflectorArduinoController:
                         reflector_data['statistics']['session_count'] = count
                         reflector_data['statistics']['daily_count'] = count
                         reflector_data['statistics']['total_count'] = count
-                        
-                        # Update health tracking
-                        self.sensor_health_stats['reflector_last_seen'] = current_time
-                        self.sensor_health_stats['reflector_updates'] += 1
                     
-                    self.reflector_updates_count += 1
+                    # Update health tracking - reader-thread-only slots
+                    self.sensor_health_stats['reflector_last_seen'] = current_time
+                    self.sensor_health_stats['reflector_updates'] += 1
+                    self._note_reflector_update()
                     
                     # Log new detections
                     if count > old_count:
-                        logger.debug(f"R-format reflector update: Count={count} (+{count-old_count}), Voltage={voltage:.2f}V, Speed={avg_speed:.1f}rpm")
+                        logger.debug("R-format reflector update: Count=%d (+%d), Voltage=%.2fV, Speed=%.1frpm", count, count - old_count, voltage, avg_speed)
                     
                     return
                         
                 except (ValueError, IndexError) as e:
-                    logger.debug(f"Could not parse R: format line '{line}': {e}")
+                    logger.debug("Could not parse R: format line '%s': %s", line, e)
             
             # 1. REFLECTOR_DETECTED format: REFLECTOR_DETECTED:123 [VOLTAGE:4.32V] [SPEED:45.2rpm]
-            reflector_detected_match = self.reflector_detected_pattern.search(line)
+            reflector_detected_match = self.reflector_detected_pattern.match(line) if line.startswith("REFLECTOR_DETECTED:") else None
             if reflector_detected_match:
                 count, voltage, speed = reflector_detected_match.groups()
                 self._update_reflector_detection(int(count), float(voltage), float(speed))
-                self.reflector_updates_count += 1
+                self._note_reflector_update()
                 return
             
             # 2. DUAL_TEMP format: DUAL_TEMP [TEMP1:33.45] [TEMP2:34.12] [MAX:34.12]
-            dual_match = self.dual_temp_pattern.search(line)
+            dual_match = self.dual_temp_pattern.match(line) if line.startswith("DUAL_TEMP") else None
             if dual_match:
                 temp1, temp2, max_temp = dual_match.groups()
                 self._update_dual_temperatures(float(temp1), float(temp2), float(max_temp))
-                self.temp_updates_count += 1
+                self._note_temp_update()
                 return
             
-            # 3. Individual temperature + reflector extractions from ACK messages
+            # 3. Individual temperature + reflector extractions from ACK messages and HB_DUAL heartbeats
+            # HB_DUAL [TEMP1:33.45] [TEMP2:34.12] [MAX:34.12] [REFLECTOR:123] [REF_SPEED:45.2]
             temp1_match = self.temp1_pattern.search(line)
             temp2_match = self.temp2_pattern.search(line)
             max_match = self.max_temp_pattern.search(line)
-            reflector_match = self.reflector_pattern.search(line)
             
             if temp1_match and temp2_match and max_match:
                 temp1, temp2, max_temp = float(temp1_match.group(1)), float(temp2_match.group(1)), float(max_match.group(1))
                 self._update_dual_temperatures(temp1, temp2, max_temp)
-                self.temp_updates_count += 1
+                self._note_temp_update()
                 
                 # Extract reflector count if present
+                reflector_match = self.reflector_pattern.search(line)
                 if reflector_match:
                     reflector_count = int(reflector_match.group(1))
                     self._update_reflector_count(reflector_count)
-                    self.reflector_updates_count += 1
+                    self._note_reflector_update()
+                
+                # Heartbeat also carries the average reflector speed
+                ref_speed_match = self.ref_speed_pattern.search(line)
+                if ref_speed_match:
+                    reflector_data['average_speed'] = float(ref_speed_match.group(1))
                 
                 return
             
-            # 4. HEARTBEAT with dual temperature + reflector
-            # HB_DUAL [TEMP1:33.45] [TEMP2:34.12] [MAX:34.12] [REFLECTOR:123] [REF_SPEED:45.2]
+            # 4. HEARTBEAT without a complete temperature set - nothing to update
             if "HB_DUAL" in line:
-                temp1_match = self.temp1_pattern.search(line)
-                temp2_match = self.temp2_pattern.search(line)
-                max_match = self.max_temp_pattern.search(line)
-                reflector_match = self.reflector_pattern.search(line)
-                ref_speed_match = re.search(r'\[REF_SPEED:([\d.-]+)\]', line)
-                
-                if temp1_match and temp2_match and max_match:
-                    temp1, temp2, max_temp = float(temp1_match.group(1)), float(temp2_match.group(1)), float(max_match.group(1))
-                    self._update_dual_temperatures(temp1, temp2, max_temp)
-                    self.temp_updates_count += 1
-                    
-                    # Update reflector data
-                    if reflector_match:
-                        reflector_count = int(reflector_match.group(1))
-                        self._update_reflector_count(reflector_count)
-                        
-                    if ref_speed_match:
-                        ref_speed = float(ref_speed_match.group(1))
-                        with state_lock:
-                            reflector_data['average_speed'] = ref_speed
-                        
-                        self.reflector_updates_count += 1
-                
                 return
             
             # 5. Standard HEARTBEAT format
-            heartbeat_match = self.heartbeat_pattern.search(line)
+            heartbeat_match = self.heartbeat_pattern.match(line) if line.startswith("HEARTBEAT:") else None
             if heartbeat_match:
                 uptime, armed, brake_active, relay_brake_active, temp, temp_alarm, motor_count = heartbeat_match.groups()
                 
@@ -727,12 +893,12 @@ class DualTempReflectorArduinoController:
                                 temperature_data['alarm_start_time'] = current_time
                                 temperature_data['alarm_count'] += 1
                                 system_state['temperature_emergency'] = True
-                                logger.warning(f"Temperature alarm via heartbeat! Max temp: {max_temp}°C")
+                                logger.warning("Temperature alarm via heartbeat! Max temp: %s°C", max_temp)
                             else:
                                 system_state['temperature_emergency'] = False
-                                logger.info(f"Temperature alarm cleared via heartbeat - Max temp: {max_temp}°C")
+                                logger.info("Temperature alarm cleared via heartbeat - Max temp: %s°C", max_temp)
                 
-                logger.debug(f"Heartbeat: MaxTemp={max_temp}°C, Alarm={temp_alarm_active}")
+                logger.debug("Heartbeat: MaxTemp=%s°C, Alarm=%s", max_temp, temp_alarm_active)
                 return
             
             # 6. Temperature alarm messages with reflector count - SADECE SENSÖR VARSA
@@ -757,9 +923,9 @@ class DualTempReflectorArduinoController:
                             reflector_count = int(reflector_match.group(1))
                             self._update_reflector_count(reflector_count)
                         
-                        logger.warning(f"TEMP_ALARM detected! Max Temperature: {temp_value}°C, Reflector count: {reflector_data['count']}")
+                        logger.warning("TEMP_ALARM detected! Max Temperature: %s°C, Reflector count: %s", temp_value, reflector_data['count'])
                     except ValueError as e:
-                        logger.debug(f"Could not parse TEMP_ALARM value: {e}")
+                        logger.debug("Could not parse TEMP_ALARM value: %s", e)
                 return
             
             # 7. Temperature safe messages with reflector count - SADECE SENSÖR VARSA
@@ -782,9 +948,9 @@ class DualTempReflectorArduinoController:
                             reflector_count = int(reflector_match.group(1))
                             self._update_reflector_count(reflector_count)
                         
-                        logger.info(f"TEMP_SAFE detected! Max Temperature: {temp_value}°C, Reflector count: {reflector_data['count']}")
+                        logger.info("TEMP_SAFE detected! Max Temperature: %s°C, Reflector count: %s", temp_value, reflector_data['count'])
                     except ValueError as e:
-                        logger.debug(f"Could not parse TEMP_SAFE value: {e}")
+                        logger.debug("Could not parse TEMP_SAFE value: %s", e)
                 return
             
             # 8. Sensor connection warnings - Arduino'dan gelen bağlantı durumları
@@ -823,51 +989,35 @@ class DualTempReflectorArduinoController:
             
             # Sensör DISCONNECTED mesajları - Arduino başlangıcında
             if "Sensor 1 (Pin 8): DISCONNECTED" in line:
-                with state_lock:
-                    temperature_data['sensor1_connected'] = False
+                temperature_data['sensor1_connected'] = False
                 logger.info("Sensor 1 (Pin 8) not detected")
                 return
             
             if "Sensor 2 (Pin 13): DISCONNECTED" in line:
-                with state_lock:
-                    temperature_data['sensor2_connected'] = False
+                temperature_data['sensor2_connected'] = False
                 logger.info("Sensor 2 (Pin 13) not detected")
                 return
             
-            # 10. Emergency stop messages with reflector final count
-            if "EMERGENCY_STOP" in line.upper():
+            # 10. Emergency stop messages with reflector final count - the sketch prints the
+            # token in upper case, so a plain substring test needs no line.upper() copy
+            if "EMERGENCY_STOP" in line:
                 # Extract final reflector count
                 if "REFLECTOR_FINAL:" in line:
-                    final_match = re.search(r'REFLECTOR_FINAL:([\d]+)', line)
+                    final_match = self.reflector_final_pattern.search(line)
                     if final_match:
                         final_count = int(final_match.group(1))
                         self._update_reflector_count(final_count)
-                        logger.warning(f"Emergency stop - Final reflector count: {final_count}")
+                        logger.warning("Emergency stop - Final reflector count: %s", final_count)
                 
-                logger.warning(f"Emergency stop detected: {line}")
-                return
-            
-            # 11. Temperature reading formats - T1:25.0 T2:26.1 MAX:26.1
-            if line.startswith("T1:") and "T2:" in line and "MAX:" in line:
-                try:
-                    parts = line.split()
-                    temp1 = float(parts[0].split(':')[1])
-                    temp2 = float(parts[1].split(':')[1])
-                    max_temp = float(parts[2].split(':')[1])
-                    
-                    self._update_dual_temperatures(temp1, temp2, max_temp)
-                    self.temp_updates_count += 1
-                    logger.debug(f"T1/T2/MAX format: S1={temp1}°C, S2={temp2}°C, Max={max_temp}°C")
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"Could not parse T1/T2/MAX line '{line}': {e}")
+                logger.warning("Emergency stop detected: %s", line)
                 return
             
-            # 12. Other system messages - debug log only
+            # 11. Other system messages - debug log only
             if line and not line.startswith("ACK:") and not "PONG" in line and not "CMD:" in line:
-                logger.debug(f"Arduino line: {line}")
+                logger.debug("Arduino line: %s", line)
                 
         except Exception as e:
-            logger.error(f"Dual temp + reflector line parsing error for '{line}': {e}")
+            logger.error("Dual temp + reflector line parsing error for '%s': %s", line, e)
 
     def _update_reflector_detection(self, count, voltage, speed):
         """Update reflector data when detection occurs - FIXED"""
@@ -895,10 +1045,10 @@ class DualTempReflectorArduinoController:
                 reflector_data['system_active'] = True
             
             if count > old_count:
-                logger.info(f"Reflector detection #{count} (+{count-old_count}): {voltage:.2f}V, Speed: {speed:.1f}rpm")
+                logger.info("Reflector detection #%d (+%d): %.2fV, Speed: %.1frpm", count, count - old_count, voltage, speed)
             
         except Exception as e:
-            logger.error(f"Reflector detection update error: {e}")
+            logger.error("Reflector detection update error: %s", e)
     
     def _update_reflector_count(self, count):
         """Simple reflector count update - FIXED"""
@@ -922,10 +1072,10 @@ class DualTempReflectorArduinoController:
                 reflector_data['system_active'] = True
             
             if count != old_count:
-                logger.debug(f"Reflector count updated: {old_count} -> {count}")
+                logger.debug("Reflector count updated: %s -> %s", old_count, count)
             
         except Exception as e:
-            logger.error(f"Reflector count update error: {e}")
+            logger.error("Reflector count update error: %s", e)
     
     def _update_dual_temperatures(self, temp1, temp2, max_temp):
         """Update dual temperature data with enhanced tracking - SENSOR DETECTION ADDED - FIXED"""
@@ -966,36 +1116,35 @@ class DualTempReflectorArduinoController:
                 if max_temp > temperature_data['max_temp_reached']:
                     temperature_data['max_temp_reached'] = max_temp
                 
-                # Update sensor health tracking
-                self.sensor_health_stats['sensor1_last_seen'] = current_time
-                self.sensor_health_stats['sensor2_last_seen'] = current_time
-                self.sensor_health_stats['sensor1_updates'] += 1
-                self.sensor_health_stats['sensor2_updates'] += 1
-                self.sensor_health_stats['dual_updates'] += 1
-                
-                # Add to temperature history (limited frequency)
-                if len(temperature_data['temp_history']) == 0 or \
-                   (current_time - datetime.fromisoformat(temperature_data['temp_history'][-1]['timestamp'])).total_seconds() >= 0.5:
+                # Add to temperature history (limited frequency) - throttled on the monotonic clock
+                # instead of re-parsing the previous entry's ISO timestamp on every sample
+                now_mono = time.monotonic()
+                if len(temperature_data['temp_history']) == 0 or now_mono - self.last_temp_history_time >= 0.5:
+                    self.last_temp_history_time = now_mono
                     temperature_data['temp_history'].append({
                         'timestamp': current_time.isoformat(),
                         'sensor1_temp': temp1,
                         'sensor2_temp': temp2,
                         'max_temp': max_temp
                     })
-                    
-                    # Keep history limited
-                    if len(temperature_data['temp_history']) > MAX_TEMP_HISTORY:
-                        temperature_data['temp_history'] = temperature_data['temp_history'][-MAX_TEMP_HISTORY:]
-                
-                # Log significant changes
-                if abs(max_temp - old_max) > 0.5:
-                    logger.info(f"Dual Temperature Update: S1={temp1:.1f}°C, S2={temp2:.1f}°C, Max={max_temp:.1f}°C")
-                    
-                # Check for large sensor differences
-                temp_diff = abs(temp1 - temp2)
-                if temp_diff > TEMP_DIFF_WARNING:
-                    logger.warning(f"Large sensor difference: S1={temp1:.1f}°C, S2={temp2:.1f}°C (Diff: {temp_diff:.1f}°C)")
+            
+            # Sensor health tracking - only this reader thread writes these slots, no lock needed
+            health = self.sensor_health_stats
+            health['sensor1_last_seen'] = current_time
+            health['sensor2_last_seen'] = current_time
+            health['sensor1_updates'] += 1
+            health['sensor2_updates'] += 1
+            health['dual_updates'] += 1
+            
+            # Log significant changes - outside the lock so log I/O never delays readers
+            if abs(max_temp - old_max) > 0.5:
+                logger.info(f"Dual Temperature Update: S1={temp1:.1f}°C, S2={temp2:.1f}°C, Max={max_temp:.1f}°C")
                 
+            # Check for large sensor differences
+            temp_diff = abs(temp1 - temp2)
+            if temp_diff > TEMP_DIFF_WARNING:
+                logger.warning(f"Large sensor difference: S1={temp1:.1f}°C, S2={temp2:.1f}°C (Diff: {temp_diff:.1f}°C)")
+            
         except Exception as e:
             logger.error(f"Dual temperature update error: {e}")
     
@@ -1024,60 +1173,75 @@ class DualTempReflectorArduinoController:
         logger.info("Command processor thread started")
         while not shutdown_event.is_set():
             try:
-                if not self.command_queue.empty():
-                    try:
-                        command_data = self.command_queue.get(timeout=1)
-                        self._execute_command(command_data)
-                        self.command_queue.task_done()
-                    except queue.Empty:
-                        continue
-                else:
-                    time.sleep(0.05)
+                # Blocks until a command arrives; disconnect() wakes us with a None sentinel
+                command_data = self.command_queue.get()
+                if command_data is None:
+                    break
+                self._execute_command(command_data)
                     
             except Exception as e:
                 logger.error(f"Command processor error: {e}")
-                time.sleep(0.5)
+                shutdown_event.wait(0.5)
         
         logger.info("Command processor thread stopped")
     
     def _connection_monitor(self):
         """Background connection monitor"""
         logger.info("Connection monitor thread started")
+        reconnect_wait = RECONNECT_INTERVAL
         while not shutdown_event.is_set():
             try:
                 if self.is_connected:
-                    # Send periodic heartbeat
-                    if time.time() - self.last_command_time > 60:
+                    reconnect_wait = RECONNECT_INTERVAL
+                    # Send heartbeat once the link has been idle for HEARTBEAT_INTERVAL
+                    idle = time.monotonic() - self.last_command_time
+                    if idle >= HEARTBEAT_INTERVAL:
                         success, _ = self.send_command_sync("PING", timeout=1.0)
                         if not success:
-                            logger.warning("Heartbeat failed - connection may be lost")
-                            self.is_connected = False
-                            system_state['connected'] = False
-                            system_state['reflector_system_enabled'] = False
+                            self._mark_link_lost("Heartbeat failed")
+                        continue
+                    wait_time = HEARTBEAT_INTERVAL - idle
                 else:
                     # Try to reconnect
+                    self.link_event.clear()
                     logger.info("Attempting automatic reconnection...")
-                    if self.connect():
-                        logger.info("Automatic reconnection successful")
-                        # Restart monitoring threads if needed
-                        self._restart_monitoring_threads()
+                    if self.reconnect_attempts >= self.max_attempts:
+                        # connect() refuses past max_attempts - rescan the port and start over
+                        reconnected = self.reconnect()
                     else:
-                        time.sleep(5)
+                        reconnected = self.connect()
+                        if reconnected:
+                            # Restart monitoring threads if needed
+                            self._restart_monitoring_threads()
+                    if reconnected:
+                        logger.info("Automatic reconnection successful")
+                        continue
+                    # Double the wait between failed attempts so a long outage costs few handshakes
+                    wait_time = reconnect_wait
+                    reconnect_wait = min(reconnect_wait * 2, RECONNECT_MAX_INTERVAL)
                 
-                time.sleep(10)
+                # Sleep until the next heartbeat is due or the reader reports a lost link
+                if self.link_event.wait(wait_time):
+                    self.link_event.clear()
                 
             except Exception as e:
                 logger.error(f"Connection monitor error: {e}")
-                time.sleep(5)
+                shutdown_event.wait(5)
         
         logger.info("Connection monitor thread stopped")
     
+    def _mark_link_lost(self, reason):
+        """Flag the Arduino link as down and wake the connection monitor right away"""
+        logger.warning(f"{reason} - connection may be lost")
+        self.is_connected = False
+        system_state['connected'] = False
+        system_state['reflector_system_enabled'] = False
+        self.link_event.set()
+    
     def _restart_monitoring_threads(self):
         """Restart monitoring threads after reconnection"""
         if not self.continuous_reader_thread or not self.continuous_reader_thread.is_alive():
             self._start_continuous_reader()
-        if not self.temp_stats_thread or not self.temp_stats_thread.is_alive():
-            self._start_temp_stats_monitor()
         if not self.sensor_health_thread or not self.sensor_health_thread.is_alive():
             self._start_sensor_health_monitor()
         if not self.reflector_stats_thread or not self.reflector_stats_thread.is_alive():
@@ -1090,64 +1254,78 @@ class DualTempReflectorArduinoController:
         
         try:
             with self.connection_lock:
-                # Rate limiting
-                current_time = time.time()
-                time_since_last = current_time - self.last_command_time
-                if time_since_last < 0.02:
-                    time.sleep(0.02 - time_since_last)
+                # No fixed inter-command delay: each command waits for the Arduino's
+                # reply line below, which paces the link at the sketch's own speed
+                # Replies are read by the continuous reader (the only thread reading
+                # the port) and handed to us through this queue while we wait
+                replies = queue.SimpleQueue()
+                self.reply_queue = replies
+                echo_line = None
+                reply_line = None
                 
-                # Send command
-                command_bytes = f"{command}\n".encode('utf-8')
-                self.connection.write(command_bytes)
-                self.connection.flush()
-                self.last_command_time = time.time()
-                
-                # Read response
-                start_time = time.time()
-                response = ""
-                
-                while time.time() - start_time < timeout:
-                    if shutdown_event.is_set():
-                        return False, "Shutdown requested"
+                try:
+                    # Send command
+                    command_bytes = COMMAND_BYTES.get(command) or f"{command}\n".encode('utf-8')
+                    self.connection.write(command_bytes)
+                    self.connection.flush()
+                    sent_at = time.monotonic()
+                    self.last_command_time = sent_at
                     
-                    if self.connection.in_waiting > 0:
+                    # Wait for the reply line - blocks in get(), no polling
+                    # The sketch trims and upper-cases the command before echoing it
+                    expected_echo = f"CMD: {command.strip().upper()}"
+                    deadline = sent_at + timeout
+                    monotonic = time.monotonic
+                    next_line = replies.get
+                    while True:
+                        remaining = deadline - monotonic()
+                        if remaining <= 0:
+                            break
+                        
                         try:
-                            data = self.connection.read(self.connection.in_waiting)
-                            response += data.decode('utf-8', errors='ignore')
-                            
-                            # Check for command completion
-                            completion_keywords = ["MOTOR_STARTED", "MOTOR_STOPPED", "LEV_GROUP_STARTED", 
-                                                 "THR_GROUP_STARTED", "ARMED", "RELAY_BRAKE:", 
-                                                 "PONG", "ACK:", "BRAKE_", "DISARMED", "EMERGENCY_STOP",
-                                                 "DUAL-TEMP", "TEMP_DUAL", "REFLECTOR_RESET", "REFLECTOR_FULL",
-                                                 "FAULT-TOLERANT"]
-                            
-                            if any(keyword in response for keyword in completion_keywords):
-                                break
-                            
-                            if '\n' in response or len(response) > 150:
-                                break
-                        except Exception as e:
-                            logger.debug(f"Read error: {e}")
+                            line = next_line(timeout=min(remaining, REPLY_WAIT_SLICE))
+                        except queue.Empty:
+                            if shutdown_event.is_set():
+                                return False, "Shutdown requested"
+                            continue
+                        
+                        # Arduino echoes every command as "CMD: <command>" first - not a reply.
+                        # Only our own echo opens the reply window, so a late reply to an
+                        # earlier (timed-out) command is never taken as this one's
+                        if line.startswith("CMD:"):
+                            if line == expected_echo:
+                                echo_line = line
+                            continue
+                        
+                        if echo_line is None:
+                            continue
+                        
+                        # Check for command completion - telemetry lines are skipped
+                        if any(keyword in line for keyword in COMMAND_REPLY_KEYWORDS):
+                            reply_line = line
                             break
-                    
-                    time.sleep(0.01)
+                finally:
+                    self.reply_queue = None
                 
                 # Update statistics
                 with state_lock:
                     system_state['commands'] += 1
                     system_state['last_response'] = datetime.now()
                 
-                response = response.strip()
-                if response:
-                    logger.debug(f"Command '{command}' response: '{response}'")
-                    return True, response
-                else:
-                    logger.warning(f"Command '{command}' got empty response")
-                    return False, "Empty response"
+                # Only a completion line counts - an echo alone means the command went unanswered
+                if reply_line is None:
+                    if echo_line is not None:
+                        logger.warning("Command '%s' echoed but got no reply", command)
+                    else:
+                        logger.warning("Command '%s' got empty response", command)
+                    return False, "Timeout"
+                
+                response = f"{echo_line}\n{reply_line}" if echo_line is not None else reply_line
+                logger.debug("Command '%s' response: '%s'", command, response)
+                return True, response
                 
         except Exception as e:
-            logger.error(f"Sync command error for '{command}': {e}")
+            logger.error("Sync command error for '%s': %s", command, e)
             with state_lock:
                 system_state['errors'] += 1
             return False, str(e)
@@ -1165,20 +1343,20 @@ class DualTempReflectorArduinoController:
             success, response = self.send_command_sync(command, timeout=1.5)
             
             if success:
-                logger.debug(f"Command executed: {command}")
+                logger.debug("Command executed: %s", command)
             else:
                 if attempts < max_attempts:
                     command_data['attempts'] = attempts + 1
-                    try:
-                        self.command_queue.put(command_data, timeout=0.05)
-                        logger.debug(f"Retrying command: {command}")
-                    except queue.Full:
-                        logger.warning(f"Queue full, dropping command: {command}")
+                    if self.command_queue.qsize() < MAX_COMMAND_QUEUE:
+                        self.command_queue.put(command_data)
+                        logger.debug("Retrying command: %s", command)
+                    else:
+                        logger.warning("Queue full, dropping command: %s", command)
                 else:
-                    logger.error(f"Command failed: {command}")
+                    logger.error("Command failed: %s", command)
                 
         except Exception as e:
-            logger.error(f"Command execution error: {e}")
+            logger.error("Command execution error: %s", e)
     
     def reconnect(self):
         """Manual reconnect with full reset - FIXED"""
@@ -1245,12 +1423,13 @@ class DualTempReflectorArduinoController:
         if not keep_threads:
             logger.info("Stopping background threads...")
             shutdown_event.set()
+            self.command_queue.put(None)  # Wake the blocked command processor
+            self.link_event.set()         # Wake the connection monitor
             
             threads = [
                 (self.processor_thread, "CommandProcessor"),
                 (self.monitor_thread, "ConnectionMonitor"),
                 (self.continuous_reader_thread, "ContinuousReader"),
-                (self.temp_stats_thread, "TempStatsMonitor"),
                 (self.sensor_health_thread, "SensorHealthMonitor"),
                 (self.reflector_stats_thread, "ReflectorStatsMonitor")
             ]
@@ -1276,11 +1455,20 @@ except Exception as e:
 def get_status():
     """Get comprehensive system status including DUAL temperature + reflector data - FIXED"""
     try:
+        # Read controller fields once, outside the state lock
+        controller = arduino_controller
+        is_connected = controller.is_connected if controller else False
+        reconnect_attempts = controller.reconnect_attempts if controller else 0
+        port = controller.port if controller else None
+        baudrate = controller.baudrate if controller else None
+        
+        # Snapshot shared state under one lock; serialize after releasing it
         with state_lock:
-            uptime_seconds = (datetime.now() - system_state['uptime']).total_seconds()
+            now = datetime.now()
+            uptime_seconds = (now - system_state['uptime']).total_seconds()
             
-            return jsonify({
-                'connected': arduino_controller.is_connected if arduino_controller else False,
+            status = {
+                'connected': is_connected,
                 'armed': system_state['armed'],
                 'motors': motor_states.copy(),
                 'individual_speeds': individual_motor_speeds.copy(),
@@ -1321,7 +1509,7 @@ def get_status():
                     'system_active': reflector_data['system_active'],
                     'detections': reflector_data['detections'],
                     'read_frequency': reflector_data['read_frequency'],
-                    'calibration': reflector_data['calibration_data'],
+                    'calibration': dict(reflector_data['calibration_data']),
                     'performance': {
                         'total_runtime': reflector_data['performance']['total_runtime'],
                         'detection_rate': reflector_data['performance']['detection_rate'],
@@ -1341,20 +1529,22 @@ def get_status():
                     'errors': system_state['errors'],
                     'uptime_seconds': int(uptime_seconds),
                     'last_response': system_state['last_response'].isoformat() if system_state['last_response'] else None,
-                    'reconnect_attempts': arduino_controller.reconnect_attempts if arduino_controller else 0,
+                    'reconnect_attempts': reconnect_attempts,
                     'reflector_system_enabled': system_state['reflector_system_enabled'],
                     'temperature_monitoring_required': system_state['temperature_monitoring_required']
                 },
                 'port_info': {
-                    'port': arduino_controller.port if arduino_controller else None,
-                    'baudrate': arduino_controller.baudrate if arduino_controller else None
+                    'port': port,
+                    'baudrate': baudrate
                 },
-                'timestamp': datetime.now().isoformat(),
-                'version': '3.7-DUAL-TEMPERATURE-REFLECTOR-FIXED'
-            })
+                'timestamp': cached_now_iso(),
+                'version': API_VERSION
+            }
+        
+        return json_response(status)
     except Exception as e:
-        logger.error(f"Status endpoint error: {e}")
-        return jsonify({'error': str(e), 'connected': False}), 500
+        logger.error("Status endpoint error: %s", e)
+        return json_response({'error': str(e), 'connected': False}), 500
 
 # REFLECTOR SYSTEM API ROUTES - FIXED
 
@@ -1366,7 +1556,7 @@ def get_reflector_data():
             current_time = datetime.now()
             last_update_age = (current_time - reflector_data['last_update']).total_seconds()
             
-            return jsonify({
+            return json_response({
                 'count': reflector_data['count'],
                 'voltage': reflector_data['voltage'],
                 'state': reflector_data['state'],
@@ -1395,49 +1585,45 @@ def get_reflector_data():
                     'daily_start': reflector_data['statistics']['daily_start'].isoformat()
                 },
                 'status': 'active' if reflector_data['system_active'] else 'inactive',
-                'timestamp': current_time.isoformat()
+                'timestamp': cached_now_iso()
             })
     except Exception as e:
-        logger.error(f"Reflector data endpoint error: {e}")
-        return jsonify({'error': str(e)}), 500
+        logger.error("Reflector data endpoint error: %s", e)
+        return json_response({'error': str(e)}), 500
 
 @app.route('/api/reflector/reset', methods=['POST'])
+@requires_arduino
 def reset_reflector_counter():
     """Reset reflector counter - FIXED"""
-    if not arduino_controller or not arduino_controller.is_connected:
-        return jsonify({
-            'status': 'error',
-            'message': 'Arduino not connected'
-        }), 503
-    
     try:
         success, response = arduino_controller.send_command_sync("REFLECTOR_RESET", timeout=3.0)
         
-        if success and ("REFLECTOR_RESET" in response or "Complete" in response):
+        # "REFLECTOR_RESET:" is the sketch's reply - the "CMD: REFLECTOR_RESET" echo has no colon
+        if success and ("REFLECTOR_RESET:" in response or "Complete" in response):
             with state_lock:
                 reflector_data['count'] = 0
                 reflector_data['detections'] = 0
                 reflector_data['statistics']['session_count'] = 0
                 reflector_data['statistics']['session_start'] = datetime.now()
                 reflector_data['performance']['uptime_start'] = datetime.now()
-                reflector_data['performance']['speed_history'] = []
+                reflector_data['performance']['speed_history'].clear()
             
             logger.info("Reflector counter reset successfully")
-            return jsonify({
+            return json_response({
                 'status': 'success',
                 'message': 'Reflector counter reset successfully',
                 'arduino_response': response,
                 'reset_time': datetime.now().isoformat()
             })
         else:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': f'Reset failed: {response}'
             }), 500
             
     except Exception as e:
-        logger.error(f"Reflector reset error: {e}")
-        return jsonify({
+        logger.error("Reflector reset error: %s", e)
+        return json_response({
             'status': 'error',
             'message': str(e)
         }), 500
@@ -1450,7 +1636,7 @@ def get_realtime_reflector():
             current_time = datetime.now()
             last_update_age = (current_time - reflector_data['last_update']).total_seconds()
             
-            return jsonify({
+            return json_response({
                 'count': reflector_data['count'],
                 'voltage': reflector_data['voltage'],
                 'state': reflector_data['state'],
@@ -1460,12 +1646,12 @@ def get_realtime_reflector():
                 'system_active': reflector_data['system_active'],
                 'last_update': reflector_data['last_update'].isoformat(),
                 'age_seconds': last_update_age,
-                'timestamp': current_time.isoformat(),
+                'timestamp': cached_now_iso(),
                 'status': 'real-time' if last_update_age < 2.0 else 'delayed'
             })
     except Exception as e:
-        logger.error(f"Realtime reflector error: {e}")
-        return jsonify({'error': str(e)}), 500
+        logger.error("Realtime reflector error: %s", e)
+        return json_response({'error': str(e)}), 500
 
 @app.route('/api/temperature/realtime', methods=['GET'])
 def get_realtime_temperature():
@@ -1477,7 +1663,7 @@ def get_realtime_temperature():
             temp_diff = abs(temperature_data['sensor1_temp'] - temperature_data['sensor2_temp']) if \
                        temperature_data['sensor1_connected'] and temperature_data['sensor2_connected'] else 0
             
-            return jsonify({
+            return json_response({
                 'temperature': temperature_data['current_temp'],
                 'sensor1_temp': temperature_data['sensor1_temp'],
                 'sensor2_temp': temperature_data['sensor2_temp'],
@@ -1494,85 +1680,118 @@ def get_realtime_temperature():
                 'reflector_count': reflector_data['count'],
                 'reflector_speed': reflector_data['average_speed'],
                 'reflector_voltage': reflector_data['voltage'],
-                'timestamp': current_time.isoformat(),
+                'timestamp': cached_now_iso(),
                 'status': 'real-time' if last_update_age < 1.0 else 'delayed',
                 'dual_sensor_mode': True,
                 'reflector_system_active': reflector_data['system_active']
             })
     except Exception as e:
-        logger.error(f"Realtime temperature + reflector error: {e}")
-        return jsonify({'error': str(e)}), 500
+        logger.error("Realtime temperature + reflector error: %s", e)
+        return json_response({'error': str(e)}), 500
+
+def build_ping_payload():
+    """Health check payload - shared by the Flask view and the WSGI fast path"""
+    # Controller fields are read outside the lock; thread liveness is not shared state
+    controller = arduino_controller
+    arduino_connected = controller.is_connected if controller else False
+    port = controller.port if controller else None
+    performance = {
+        'continuous_reader': controller.continuous_reader_thread.is_alive() if controller and controller.continuous_reader_thread else False,
+        'sensor_health_monitor': controller.sensor_health_thread.is_alive() if controller and controller.sensor_health_thread else False,
+        'reflector_stats_monitor': controller.reflector_stats_thread.is_alive() if controller and controller.reflector_stats_thread else False,
+        'optimization': 'dual-sensor-reflector-ultra-fast'
+    }
+    
+    with state_lock:
+        now = datetime.now()
+        temp_age = (now - temperature_data['last_temp_update']).total_seconds()
+        reflector_age = (now - reflector_data['last_update']).total_seconds()
+        temp_diff = abs(temperature_data['sensor1_temp'] - temperature_data['sensor2_temp']) if \
+                   temperature_data['sensor1_connected'] and temperature_data['sensor2_connected'] else 0
+        
+        payload = {
+            'status': 'ok',
+            'timestamp': cached_now_iso(),
+            'arduino_connected': arduino_connected,
+            'dual_temperatures': {
+                'sensor1_temp': temperature_data['sensor1_temp'],
+                'sensor2_temp': temperature_data['sensor2_temp'],
+                'max_temp': temperature_data['current_temp'],
+                'temperature_difference': temp_diff,
+                'sensor1_connected': temperature_data['sensor1_connected'],
+                'sensor2_connected': temperature_data['sensor2_connected'],
+                'sensors_detected': temperature_data['sensors_detected'],
+                'monitoring_enabled': temperature_data['monitoring_enabled'],
+                'alarm': temperature_data['temp_alarm'],
+                'age_seconds': temp_age,
+                'frequency_hz': temperature_data['update_frequency'],
+                'status': 'real-time' if temp_age < 1.0 else 'delayed'
+            },
+            'reflector_system': {
+                'count': reflector_data['count'],
+                'voltage': reflector_data['voltage'],
+                'average_speed': reflector_data['average_speed'],
+                'instant_speed': reflector_data['instant_speed'],
+                'system_active': reflector_data['system_active'],
+                'read_frequency': reflector_data['read_frequency'],
+                'age_seconds': reflector_age,
+                'status': 'real-time' if reflector_age < 2.0 else 'delayed'
+            },
+            'performance': performance,
+            'system_status': {
+                'armed': system_state['armed'],
+                'temperature_emergency': system_state['temperature_emergency'],
+                'reflector_system_enabled': system_state['reflector_system_enabled'],
+                'temperature_monitoring_required': system_state['temperature_monitoring_required']
+            },
+            'version': API_VERSION,
+            'port': port
+        }
+    
+    return payload
 
 @app.route('/api/ping', methods=['GET'])
 def ping():
     """Ultra-fast health check with DUAL temperature + reflector info - FIXED"""
     try:
-        with state_lock:
-            temp_age = (datetime.now() - temperature_data['last_temp_update']).total_seconds()
-            reflector_age = (datetime.now() - reflector_data['last_update']).total_seconds()
-            temp_diff = abs(temperature_data['sensor1_temp'] - temperature_data['sensor2_temp']) if \
-                       temperature_data['sensor1_connected'] and temperature_data['sensor2_connected'] else 0
-            
-            return jsonify({
-                'status': 'ok',
-                'timestamp': datetime.now().isoformat(),
-                'arduino_connected': arduino_controller.is_connected if arduino_controller else False,
-                'dual_temperatures': {
-                    'sensor1_temp': temperature_data['sensor1_temp'],
-                    'sensor2_temp': temperature_data['sensor2_temp'],
-                    'max_temp': temperature_data['current_temp'],
-                    'temperature_difference': temp_diff,
-                    'sensor1_connected': temperature_data['sensor1_connected'],
-                    'sensor2_connected': temperature_data['sensor2_connected'],
-                    'sensors_detected': temperature_data['sensors_detected'],
-                    'monitoring_enabled': temperature_data['monitoring_enabled'],
-                    'alarm': temperature_data['temp_alarm'],
-                    'age_seconds': temp_age,
-                    'frequency_hz': temperature_data['update_frequency'],
-                    'status': 'real-time' if temp_age < 1.0 else 'delayed'
-                },
-                'reflector_system': {
-                    'count': reflector_data['count'],
-                    'voltage': reflector_data['voltage'],
-                    'average_speed': reflector_data['average_speed'],
-                    'instant_speed': reflector_data['instant_speed'],
-                    'system_active': reflector_data['system_active'],
-                    'read_frequency': reflector_data['read_frequency'],
-                    'age_seconds': reflector_age,
-                    'status': 'real-time' if reflector_age < 2.0 else 'delayed'
-                },
-                'performance': {
-                    'continuous_reader': arduino_controller.continuous_reader_thread.is_alive() if arduino_controller and arduino_controller.continuous_reader_thread else False,
-                    'temp_stats_monitor': arduino_controller.temp_stats_thread.is_alive() if arduino_controller and arduino_controller.temp_stats_thread else False,
-                    'sensor_health_monitor': arduino_controller.sensor_health_thread.is_alive() if arduino_controller and arduino_controller.sensor_health_thread else False,
-                    'reflector_stats_monitor': arduino_controller.reflector_stats_thread.is_alive() if arduino_controller and arduino_controller.reflector_stats_thread else False,
-                    'optimization': 'dual-sensor-reflector-ultra-fast'
-                },
-                'system_status': {
-                    'armed': system_state['armed'],
-                    'temperature_emergency': system_state['temperature_emergency'],
-                    'reflector_system_enabled': system_state['reflector_system_enabled'],
-                    'temperature_monitoring_required': system_state['temperature_monitoring_required']
-                },
-                'version': '3.7-DUAL-TEMPERATURE-REFLECTOR-FIXED',
-                'port': arduino_controller.port if arduino_controller else None
-            })
+        return json_response(build_ping_payload())
         
     except Exception as e:
-        logger.error(f"Ping error: {e}")
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        logger.error("Ping error: %s", e)
+        return json_response({'status': 'error', 'message': str(e)}), 500
+
+# Health check fast path - GET /api/ping is answered before Flask routing and request setup
+_flask_wsgi_app = app.wsgi_app
+
+def ping_fast_path(environ, start_response):
+    """WSGI middleware serving GET /api/ping without Flask dispatch"""
+    if environ.get('PATH_INFO') == '/api/ping' and environ.get('REQUEST_METHOD') == 'GET':
+        try:
+            body = encode_json(build_ping_payload())
+        except Exception:
+            # Let the Flask view produce (and log) the error response
+            return _flask_wsgi_app(environ, start_response)
+        
+        start_response('200 OK', [
+            ('Content-Type', 'application/json'),
+            ('Content-Length', str(len(body))),
+            ('Access-Control-Allow-Origin', '*')
+        ])
+        return [body]
+    
+    return _flask_wsgi_app(environ, start_response)
+
+app.wsgi_app = ping_fast_path
 
 # MOTOR CONTROL - SAME AS BEFORE BUT FIXED CONNECTION HANDLING
 @app.route('/api/system/arm', methods=['POST'])
+@requires_arduino
 def arm_system():
     """Arm system - DUAL TEMPERATURE + REFLECTOR safety checks - FIXED"""
-    if not arduino_controller or not arduino_controller.is_connected:
-        return jsonify({'status': 'error', 'message': 'Arduino not connected'}), 503
-    
     # SADECE SENSÖR VARSA sıcaklık kontrolü yap
     if temperature_data['monitoring_enabled']:
         if temperature_data['temp_alarm']:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': 'Cannot arm - temperature alarm active',
                 'dual_temperatures': {
@@ -1590,7 +1809,7 @@ def arm_system():
         # En yüksek sıcaklık kontrolü
         max_temp = max(temperature_data['sensor1_temp'], temperature_data['sensor2_temp'])
         if max_temp > TEMP_ALARM_THRESHOLD - 5:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': f'Cannot arm - temperature too high ({max_temp:.1f}°C)',
                 'dual_temperatures': {
@@ -1604,13 +1823,14 @@ def arm_system():
     try:
         success, response = arduino_controller.send_command_sync("ARM", timeout=3.0)
         
-        if success and "ARMED" in response.upper():
-            with state_lock:
-                system_state['armed'] = True
+        if success and ARMED_REPLY_PATTERN.search(response):
+            system_state['armed'] = True  # Single-key store is atomic - readers snapshot under state_lock
             
-            logger.info(f"System ARMED - Dual Temps: S1={temperature_data['sensor1_temp']}°C, S2={temperature_data['sensor2_temp']}°C, Max={temperature_data['current_temp']}°C, Reflector: {reflector_data['count']}")
+            logger.info("System ARMED - Dual Temps: S1=%s°C, S2=%s°C, Max=%s°C, Reflector: %s",
+                        temperature_data['sensor1_temp'], temperature_data['sensor2_temp'],
+                        temperature_data['current_temp'], reflector_data['count'])
             
-            return jsonify({
+            return json_response({
                 'status': 'armed',
                 'message': 'System armed successfully',
                 'dual_temperatures': {
@@ -1629,49 +1849,62 @@ def arm_system():
                 'arm_timestamp': datetime.now().isoformat()
             })
         else:
-            return jsonify({'status': 'error', 'message': f'Arduino error: {response}'}), 500
+            return json_response({'status': 'error', 'message': f'Arduino error: {response}'}), 500
             
     except Exception as e:
-        logger.error(f"Arm system error: {e}")
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        logger.error("Arm system error: %s", e)
+        return json_response({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/reconnect', methods=['POST'])
 def reconnect_arduino():
     """Reconnect to Arduino - FIXED"""
     if not arduino_controller:
-        return jsonify({'status': 'error', 'message': 'No Arduino controller available'}), 500
+        return static_json_response(NO_CONTROLLER_BODY, 500)
     
     try:
         success = arduino_controller.reconnect()
         if success:
-            return jsonify({
+            return json_response({
                 'status': 'success',
                 'message': 'Arduino reconnected successfully',
                 'port': arduino_controller.port,
                 'timestamp': datetime.now().isoformat()
             })
         else:
-            return jsonify({
+            return json_response({
                 'status': 'error',
                 'message': 'Failed to reconnect to Arduino'
             }), 500
     except Exception as e:
-        logger.error(f"Reconnect error: {e}")
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        logger.error("Reconnect error: %s", e)
+        return json_response({'status': 'error', 'message': str(e)}), 500
 
 # Background monitoring - FIXED
 def dual_temp_reflector_background_monitor():
     """DUAL TEMPERATURE + REFLECTOR background monitoring and maintenance - FIXED"""
     logger.info("DUAL TEMPERATURE + REFLECTOR background monitor started")
     
+    reconnect_backoff = MONITOR_INTERVAL
+    
     while not shutdown_event.is_set():
         try:
-            # Connection monitoring
-            if arduino_controller and not arduino_controller.is_connected:
+            wait_time = MONITOR_INTERVAL
+            
+            # Connection monitoring - the controller's connection monitor owns reconnection;
+            # only step in (with backoff) if that thread has died
+            controller_monitor = arduino_controller.monitor_thread if arduino_controller else None
+            if (arduino_controller and not arduino_controller.is_connected
+                    and not (controller_monitor and controller_monitor.is_alive())):
                 if arduino_controller.reconnect_attempts < arduino_controller.max_attempts:
                     logger.info("Auto-reconnection attempt...")
                     if arduino_controller.reconnect():
                         logger.info("Auto-reconnection successful")
+                        reconnect_backoff = MONITOR_INTERVAL
+                    else:
+                        wait_time = reconnect_backoff
+                        reconnect_backoff = min(reconnect_backoff * 2, MONITOR_RECONNECT_MAX_WAIT)
+            else:
+                reconnect_backoff = MONITOR_INTERVAL
             
             # Monitoring logic - SADECE SENSÖR VARSA UYAR
             with state_lock:
@@ -1694,7 +1927,7 @@ def dual_temp_reflector_background_monitor():
                     reflector_data['system_active'] = True
                     system_state['reflector_system_enabled'] = True
             
-            shutdown_event.wait(5)
+            shutdown_event.wait(wait_time)
             
         except Exception as e:
             logger.error(f"Dual temperature + reflector background monitor error: {e}")
@@ -1706,10 +1939,17 @@ def dual_temp_reflector_background_monitor():
 monitor_thread = threading.Thread(target=dual_temp_reflector_background_monitor, daemon=True, name="DualTempReflectorMonitor")
 monitor_thread.start()
 
-# Graceful shutdown handler
-def signal_handler(sig, frame):
-    """Graceful shutdown handler"""
-    logger.info("Shutdown signal received...")
+# Graceful shutdown
+_shutdown_lock = threading.RLock()  # Re-entrant: a second signal may arrive mid-shutdown
+_shutdown_done = False
+
+def shutdown_backend():
+    """Stop background work and close the Arduino link - safe to call more than once"""
+    global _shutdown_done
+    with _shutdown_lock:
+        if _shutdown_done:
+            return
+        _shutdown_done = True
     
     try:
         shutdown_event.set()
@@ -1726,12 +1966,17 @@ def signal_handler(sig, frame):
         
     except Exception as e:
         logger.error(f"Shutdown error: {e}")
-    finally:
-        sys.exit(0)
 
-# Register signal handlers
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
+def signal_handler(sig, frame):
+    """Graceful shutdown handler"""
+    logger.info("Shutdown signal received...")
+    shutdown_backend()
+    sys.exit(0)
+
+# Register signal handlers - only possible from the main thread (not when imported by a server worker)
+if threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
 
 if __name__ == '__main__':
     logger.info("=" * 80)
@@ -1756,21 +2001,24 @@ if __name__ == '__main__':
             logger.warning("Arduino Status: Not Connected - Will attempt auto-reconnection")
         
         logger.info("=" * 80)
-        logger.info("Starting DUAL TEMPERATURE + REFLECTOR Flask server...")
-        
-        app.run(
-            host='0.0.0.0', 
-            port=5001, 
-            debug=False, 
-            threaded=True,
-            use_reloader=False
-        )
+        if waitress is not None:
+            logger.info("Starting DUAL TEMPERATURE + REFLECTOR server (waitress)...")
+            waitress.serve(app, host='0.0.0.0', port=5001, threads=8)
+        else:
+            logger.info("Starting DUAL TEMPERATURE + REFLECTOR Flask server...")
+            app.run(
+                host='0.0.0.0', 
+                port=5001, 
+                debug=False, 
+                threaded=True,
+                use_reloader=False
+            )
         
     except KeyboardInterrupt:
         logger.info("Interrupt received - shutting down...")
-        signal_handler(signal.SIGINT, None)
+        shutdown_backend()
     except Exception as e:
         logger.error(f"Server error: {e}")
-        signal_handler(signal.SIGTERM, None)
+        shutdown_backend()
     finally:
         logger.info("DUAL TEMPERATURE + REFLECTOR server shutdown complete")
\ No newline at end of file